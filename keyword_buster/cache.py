@@ -0,0 +1,153 @@
+import os
+import sqlite3
+import sys
+from collections import OrderedDict
+
+DEFAULT_CACHE_PATH = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+                                  'keyword-buster', 'patterns.sqlite')
+DEFAULT_MEMORY_BYTES = 64 * 1024 * 1024  # Budget for the in-process LRU
+
+
+def _entry_size(pattern, words):
+    """Rough in-memory footprint of a cached entry, in bytes."""
+    return sys.getsizeof(pattern) + sys.getsizeof(words) + sum(sys.getsizeof(word) for word in words)
+
+
+class PatternCache:
+    """Two-level cache of pattern query results.
+
+    An in-process LRU, evicted by approximate size, sits in front of an sqlite
+    store that persists across runs. Entries are keyed by (dictionary fingerprint,
+    folded pattern), so editing the dictionary invalidates them automatically.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MEMORY_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.memory = OrderedDict()  # (fingerprint, pattern) -> (words, size)
+        self.memory_bytes = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._connection = None
+
+        if path is not None:
+            try:
+                self._connection = self._open(path)
+            except (OSError, sqlite3.Error) as error:
+                # The cache is an optimisation; an unusable store must not stop the run
+                print(f'Warning: pattern cache {path} is unavailable ({error}); '
+                      f'caching in memory only', file=sys.stderr)
+                self.path = None
+
+    @staticmethod
+    def _open(path):
+        """Open (creating if needed) the sqlite store at path."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        connection = sqlite3.connect(path, timeout=30)
+        try:
+            # WAL lets concurrent runs keep reading while one of them commits
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS patterns ('
+                'fingerprint TEXT NOT NULL, pattern TEXT NOT NULL, words TEXT NOT NULL, '
+                'PRIMARY KEY (fingerprint, pattern)) WITHOUT ROWID')
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _remember(self, key, words):
+        """Insert an entry into the LRU and evict the least recently used ones over budget."""
+        size = _entry_size(key[1], words)
+        if size > self.max_bytes:
+            return
+        previous = self.memory.pop(key, None)
+        if previous is not None:
+            self.memory_bytes -= previous[1]
+        self.memory[key] = (words, size)
+        self.memory_bytes += size
+        while self.memory_bytes > self.max_bytes:
+            _, (_, evicted_size) = self.memory.popitem(last=False)
+            self.memory_bytes -= evicted_size
+
+    def get(self, fingerprint, pattern):
+        """Return the cached words for the pattern, or None on a miss."""
+        key = (fingerprint, pattern)
+        entry = self.memory.get(key)
+        if entry is not None:
+            self.memory.move_to_end(key)
+            self.memory_hits += 1
+            return entry[0]
+
+        if self._connection is not None:
+            row = self._connection.execute(
+                'SELECT words FROM patterns WHERE fingerprint = ? AND pattern = ?', key).fetchone()
+            if row is not None:
+                words = row[0].split('\n') if row[0] else []
+                self._remember(key, words)
+                self.disk_hits += 1
+                return words
+
+        self.misses += 1
+        return None
+
+    def put(self, fingerprint, pattern, words):
+        """Store the words for the pattern in both levels."""
+        key = (fingerprint, pattern)
+        self._remember(key, words)
+        if self._connection is not None:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO patterns (fingerprint, pattern, words) VALUES (?, ?, ?)',
+                (fingerprint, pattern, '\n'.join(words)))
+
+    def get_or_compute(self, fingerprint, pattern, compute):
+        """Return the cached words for the pattern, calling compute() and storing them on a miss."""
+        words = self.get(fingerprint, pattern)
+        if words is None:
+            words = compute()
+            self.put(fingerprint, pattern, words)
+        return words
+
+    def stats(self):
+        """Return hit/miss counters and the current LRU footprint."""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            'lookups': lookups,
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            'memory_entries': len(self.memory),
+            'memory_bytes': self.memory_bytes,
+        }
+
+    def format_stats(self):
+        """Return the statistics as a single human-readable line."""
+        stats = self.stats()
+        return (f"Cache: {stats['lookups']} lookups, {stats['memory_hits']} memory hits, "
+                f"{stats['disk_hits']} disk hits, {stats['misses']} misses "
+                f"({stats['hit_rate']:.0%} hit rate), {stats['memory_entries']} entries "
+                f"/ {stats['memory_bytes']} bytes in memory")
+
+    def commit(self):
+        """Write pending entries to disk and release the store's write lock.
+
+        Call this after each batch of puts; an open transaction blocks every
+        other process writing to the same cache file.
+        """
+        if self._connection is not None:
+            self._connection.commit()
+
+    def close(self):
+        """Commit pending entries to disk and close the store."""
+        if self._connection is not None:
+            self.commit()
+            self._connection.close()
+            self._connection = None
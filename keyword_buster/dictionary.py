@@ -0,0 +1,99 @@
+import bz2
+import gzip
+import hashlib
+import lzma
+import re
+import unicodedata
+
+FOLD_NONE = 'none'  # Uppercase only, as the readers always did
+FOLD_CASE = 'case'  # Unicode case folding (e.g. 'ß' matches 'SS')
+FOLD_ACCENTS = 'accents'  # Case folding plus NFKD accent stripping
+FOLD_MODES = (FOLD_NONE, FOLD_CASE, FOLD_ACCENTS)
+
+DEFAULT_DICTIONARY = '/srv/dict/words_alpha.txt'
+
+_COMPRESSED_OPENERS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+
+def open_text(filepath, mode='r', encoding='utf-8', errors='strict'):
+    """Open a text file, transparently (de)compressing .gz, .bz2 and .xz files."""
+    for suffix, opener in _COMPRESSED_OPENERS.items():
+        if filepath.endswith(suffix):
+            return opener(filepath, mode + 't', encoding=encoding, errors=errors)
+    return open(filepath, mode, encoding=encoding, errors=errors)
+
+
+def fold_word(word, fold=FOLD_ACCENTS):
+    """Return the folded, uppercase form of a word that matching runs on."""
+    if fold == FOLD_NONE:
+        return word.upper()
+    folded = word.casefold()
+    if fold == FOLD_ACCENTS:
+        decomposed = unicodedata.normalize('NFKD', folded)
+        folded = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return folded.upper()
+
+
+class WordIndex:
+    """Dictionary words kept next to their folded forms, bucketed by folded length.
+
+    Folding is paid for once here, so queries only ever fold the (short) pattern.
+    """
+
+    def __init__(self, words, fold=FOLD_ACCENTS):
+        if fold not in FOLD_MODES:
+            raise ValueError(f"Unknown fold mode: {fold!r}")
+        self.fold = fold
+        self.words = []  # Original spelling, as written in the dictionary, used for output
+        self.folded = []  # Folded form, used for matching
+        self.by_length = {}  # Folded length -> list of word ids
+        self._fingerprint = None
+
+        for word in words:
+            word = word.strip()
+            if not word:
+                continue
+            folded = fold_word(word, fold)
+            self.by_length.setdefault(len(folded), []).append(len(self.words))
+            self.words.append(word)
+            self.folded.append(folded)
+
+    @property
+    def fingerprint(self):
+        """Content hash of the dictionary and fold mode, used to key cached query results."""
+        if self._fingerprint is None:
+            digest = hashlib.sha256(f'{self.fold}:{unicodedata.unidata_version}\n'.encode())
+            digest.update('\n'.join(self.words).encode())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def __len__(self):
+        return len(self.words)
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def fold_pattern(self, pattern):
+        """Fold a query pattern the same way the dictionary was folded."""
+        return fold_word(pattern, self.fold)
+
+    def match_ids(self, pattern):
+        """Return the ids of words whose folded form matches the pattern."""
+        pattern = self.fold_pattern(pattern)
+        regex = re.compile(re.escape(pattern).replace(r'\?', '.'))
+        folded = self.folded
+        return [i for i in self.by_length.get(len(pattern), ()) if regex.fullmatch(folded[i])]
+
+    def match(self, pattern):
+        """Return the original spellings of words whose folded form matches the pattern."""
+        return [self.words[i] for i in self.match_ids(pattern)]
+
+
+def read_dictionary_words(filepath, fold=FOLD_ACCENTS, encoding='utf-8'):
+    """Read words from the specified (optionally compressed) file and return them as a folded WordIndex."""
+    try:
+        with open_text(filepath, encoding=encoding) as file:
+            return WordIndex(file, fold)
+    except UnicodeDecodeError as error:
+        raise ValueError(f"{filepath} is not valid {encoding} ({error.reason} at byte {error.start}); "
+                         f"pass the dictionary's encoding, e.g. latin-1") from error
@@ -0,0 +1,131 @@
+from itertools import product
+
+FUZZY_DISTANCES = (1, 2)  # Supported index depths; deeper indexes grow too large to build per run
+MAX_EXPANDED_WILDCARDS = 2  # Beyond this, fuzzy lookups scan the nearby length buckets instead
+
+
+def edit_distance(pattern, word, max_distance):
+    """Optimal string alignment distance where '?' in the pattern matches any letter.
+
+    Returns max_distance + 1 as soon as the distance is known to exceed max_distance.
+    """
+    if abs(len(pattern) - len(word)) > max_distance:
+        return max_distance + 1
+    previous_previous = None
+    previous = list(range(len(word) + 1))
+    for i, p in enumerate(pattern, 1):
+        current = [i] + [0] * len(word)
+        for j, w in enumerate(word, 1):
+            cost = 0 if p == '?' or p == w else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and j > 1 and p == word[j - 2]
+                    and pattern[i - 2] == w):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+def deletes(word, distance):
+    """Return every string obtained by deleting up to distance letters from the word."""
+    found = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {candidate[:i] + candidate[i + 1:] for candidate in frontier for i in range(len(candidate))}
+        found |= frontier
+    return found
+
+
+class FuzzyIndex:
+    """Symmetric-delete (SymSpell-style) index over the folded words of a WordIndex.
+
+    Every word is stored under each string reachable by deleting up to
+    max_distance of its letters, so a lookup only generates the deletes of the
+    pattern and verifies the few words that share one of them. The index lives
+    in memory and is built per process. A full index holds several million keys
+    at max_distance 2, so when the patterns are known up front, pass them: only
+    words within max_distance letters of their lengths are indexed, under just
+    the deletes those patterns reach, and lookups of other patterns are refused.
+    """
+
+    def __init__(self, word_index, max_distance=1, patterns=None):
+        if max_distance not in FUZZY_DISTANCES:
+            raise ValueError(f"max_distance must be one of {FUZZY_DISTANCES}, not {max_distance!r}")
+        self.word_index = word_index
+        self.max_distance = max_distance
+        self.by_delete = {}  # Delete string -> list of word ids
+
+        folded_words = word_index.folded
+        if patterns is None:
+            self.patterns = None
+            ids = range(len(folded_words))
+        else:
+            self.patterns = frozenset(word_index.fold_pattern(pattern) for pattern in patterns)
+            lengths = {len(pattern) + offset for pattern in self.patterns
+                       for offset in range(-max_distance, max_distance + 1)}
+            ids = [i for length in sorted(lengths) for i in word_index.by_length.get(length, ())]
+        self.alphabet = ''.join(sorted(set().union(*(folded_words[i] for i in ids))))
+
+        wanted = None  # Every delete, or only those the known patterns can look up
+        if self.patterns is not None:
+            wanted = set()
+            for pattern in self.patterns:
+                wanted.update(self._pattern_deletes(pattern, max_distance) or ())
+
+        for i in ids:
+            for delete in deletes(folded_words[i], max_distance):
+                if wanted is not None and delete not in wanted:
+                    continue
+                ids_for_delete = self.by_delete.get(delete)
+                if ids_for_delete is None:
+                    self.by_delete[delete] = [i]
+                else:
+                    ids_for_delete.append(i)
+
+    def _pattern_deletes(self, pattern, distance):
+        """Return the delete strings a lookup of the pattern probes, or None if it scans instead."""
+        wildcards = pattern.count('?')
+        if wildcards > MAX_EXPANDED_WILDCARDS:
+            return None
+        found = set()
+        parts = pattern.split('?')
+        for letters in product(self.alphabet, repeat=wildcards):
+            expanded = parts[0] + ''.join(letter + part for letter, part in zip(letters, parts[1:]))
+            found |= deletes(expanded, distance)
+        return found
+
+    def _candidate_ids(self, pattern, distance):
+        """Return ids of words that may lie within distance of the pattern."""
+        probes = self._pattern_deletes(pattern, distance)
+        if probes is None:
+            by_length = self.word_index.by_length
+            return {i for length in range(len(pattern) - distance, len(pattern) + distance + 1)
+                    for i in by_length.get(length, ())}
+
+        candidates = set()
+        for delete in probes:
+            candidates.update(self.by_delete.get(delete, ()))
+        return candidates
+
+    def match_ids(self, pattern, distance=None):
+        """Return (word id, distance) pairs within distance edits of the pattern, closest first."""
+        distance = self.max_distance if distance is None else distance
+        if distance > self.max_distance:
+            raise ValueError(f"Index was built for at most {self.max_distance} edits, not {distance}")
+        pattern = self.word_index.fold_pattern(pattern)
+        if self.patterns is not None and pattern not in self.patterns:
+            raise ValueError(f"Index was not built for the pattern {pattern!r}")
+        folded = self.word_index.folded
+        found = []
+        for i in self._candidate_ids(pattern, distance):
+            found_distance = edit_distance(pattern, folded[i], distance)
+            if found_distance <= distance:
+                found.append((i, found_distance))
+        found.sort(key=lambda item: (item[1], folded[item[0]]))
+        return found
+
+    def match(self, pattern, distance=None):
+        """Return (original spelling, distance) pairs within distance edits of the pattern."""
+        return [(self.word_index.words[i], found_distance)
+                for i, found_distance in self.match_ids(pattern, distance)]
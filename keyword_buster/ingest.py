@@ -0,0 +1,129 @@
+import argparse
+import heapq
+import os
+import sys
+import tempfile
+import unicodedata
+
+from keyword_buster.dictionary import open_text
+
+DEFAULT_MEMORY_MB = 64  # Approximate budget for the words held in memory while sorting
+MERGE_FAN_IN = 64  # Most run files merged at once
+_UNDECODABLE = '\ufffd'  # What errors='replace' leaves in place of bytes that do not decode
+
+
+def normalise_word(line):
+    """Return the dictionary form (NFC, uppercase) of an input line, or '' if it holds no word."""
+    return unicodedata.normalize('NFC', line.strip().upper())
+
+
+def _write_run(words, tmp_dir):
+    """Write a set of words as a sorted run file and return its path."""
+    fd, path = tempfile.mkstemp(prefix='run-', suffix='.txt', dir=tmp_dir)
+    with open(fd, 'w', encoding='utf-8') as file:
+        file.writelines(f'{word}\n' for word in sorted(words))
+    return path
+
+
+def _merge_unique(paths, output):
+    """Merge sorted run files into an open output file, dropping duplicates."""
+    files = [open(path, 'r', encoding='utf-8') for path in paths]
+    try:
+        previous = None
+        count = 0
+        for line in heapq.merge(*files):
+            if line != previous:
+                output.write(line)
+                previous = line
+                count += 1
+        return count
+    finally:
+        for file in files:
+            file.close()
+
+
+def sorted_runs(input_paths, memory_bytes, tmp_dir, encoding='utf-8'):
+    """Stream the inputs into deduplicated sorted run files of at most roughly memory_bytes each.
+
+    Returns the run paths and the number of lines skipped because they did not decode.
+    """
+    runs = []
+    words = set()
+    used = 0
+    skipped = 0
+    for input_path in input_paths:
+        with open_text(input_path, encoding=encoding, errors='replace') as file:
+            for line in file:
+                if _UNDECODABLE in line:
+                    skipped += 1
+                    continue
+                word = normalise_word(line)
+                if not word or word in words:
+                    continue
+                words.add(word)
+                used += sys.getsizeof(word) + 64  # String plus its share of the set's table
+                if used >= memory_bytes:
+                    runs.append(_write_run(words, tmp_dir))
+                    words.clear()
+                    used = 0
+    if words or not runs:
+        runs.append(_write_run(words, tmp_dir))
+    return runs, skipped
+
+
+def ingest(input_paths, output_path, memory_mb=DEFAULT_MEMORY_MB, tmp_dir=None, encoding='utf-8'):
+    """Build a sorted, deduplicated dictionary artifact from word lists in bounded memory.
+
+    Inputs may be gzip/bz2/xz compressed; so may the output, by its suffix.
+    Lines that do not decode are skipped rather than aborting the build.
+    Returns the number of words written and the number of lines skipped.
+    """
+    with tempfile.TemporaryDirectory(prefix='keyword-buster-', dir=tmp_dir) as work_dir:
+        runs, skipped = sorted_runs(input_paths, memory_mb * 1024 * 1024, work_dir, encoding)
+
+        # Merge in passes so the number of open run files stays bounded
+        while len(runs) > MERGE_FAN_IN:
+            merged = []
+            for start in range(0, len(runs), MERGE_FAN_IN):
+                fd, path = tempfile.mkstemp(prefix='run-', suffix='.txt', dir=work_dir)
+                with open(fd, 'w', encoding='utf-8') as output:
+                    _merge_unique(runs[start:start + MERGE_FAN_IN], output)
+                for run in runs[start:start + MERGE_FAN_IN]:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+
+        # Write next to the output under the same suffix, so compression matches and the swap is atomic
+        directory, name = os.path.split(output_path)
+        partial_path = os.path.join(directory, f'.partial-{name}')
+        try:
+            with open_text(partial_path, 'w') as output:
+                count = _merge_unique(runs, output)
+            os.replace(partial_path, output_path)
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
+    return count, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Build a sorted, deduplicated dictionary file from (optionally compressed) word lists.')
+    parser.add_argument('output', help='Dictionary file to write (.gz, .bz2 or .xz to compress it)')
+    parser.add_argument('inputs', metavar='INPUT', nargs='+',
+                        help='Word list with one word per line (.gz, .bz2 or .xz are decompressed)')
+    parser.add_argument('--memory-mb', type=float, default=DEFAULT_MEMORY_MB,
+                        help='Approximate memory used for sorting before spilling runs to disk')
+    parser.add_argument('--tmp-dir', help='Directory for temporary run files')
+    parser.add_argument('--encoding', default='utf-8', help='Text encoding of the input files')
+    args = parser.parse_args()
+
+    count, skipped = ingest(args.inputs, args.output, args.memory_mb, args.tmp_dir, args.encoding)
+    print(f'{count} words written to {args.output}')
+    if skipped:
+        print(f'{skipped} lines skipped because they are not valid {args.encoding}', file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
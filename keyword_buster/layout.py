@@ -0,0 +1,60 @@
+from functools import lru_cache
+
+LAYOUT_CACHE_SIZE = 256  # Puzzles whose layouts are kept for reuse
+
+
+class PuzzleLayout:
+    """'?'-aligned grid of a puzzle, shared by the CLI and every frontend.
+
+    Each word is a column, shifted down so all '?' characters land on the
+    keyword row. The grid is stored once, column-major, as UTF-32 code points;
+    column and row views are memoryview slices of that buffer and copy nothing.
+    Words without a '?' start at the top row.
+    """
+
+    def __init__(self, words):
+        self.words = tuple(words)
+        self.q_indexes = tuple(word.index('?') if '?' in word else None for word in self.words)
+        self.keyword_row = max((index for index in self.q_indexes if index is not None), default=0)
+        self.offsets = tuple(0 if index is None else self.keyword_row - index for index in self.q_indexes)
+        self.row_count = max((offset + len(word) for offset, word in zip(self.offsets, self.words)), default=0)
+        self.column_count = len(self.words)
+
+        rows = self.row_count
+        grid = ''.join(' ' * offset + word + ' ' * (rows - offset - len(word))
+                       for offset, word in zip(self.offsets, self.words))
+        self._grid = memoryview(grid.encode('utf-32-le')).cast('I')
+
+    def column(self, c):
+        """Return a view of the code points of column c (one aligned word)."""
+        return self._grid[c * self.row_count:(c + 1) * self.row_count]
+
+    def row(self, r):
+        """Return a strided view of the code points of row r."""
+        return self._grid[r::self.row_count]
+
+    def cell(self, r, c):
+        """Return the character at row r, column c."""
+        return chr(self._grid[c * self.row_count + r])
+
+    def row_text(self, r):
+        """Return row r as a string."""
+        return ''.join(map(chr, self.row(r)))
+
+    def column_text(self, c):
+        """Return column c (the aligned word) as a string."""
+        return ''.join(map(chr, self.column(c)))
+
+    def rows(self):
+        """Return the grid as a list of rows of characters, e.g. for tabulate."""
+        return [list(self.row_text(r)) for r in range(self.row_count)]
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def _cached_layout(words):
+    return PuzzleLayout(words)
+
+
+def puzzle_layout(words):
+    """Return the (memoised) layout of a puzzle's words."""
+    return _cached_layout(tuple(words))
@@ -1,22 +1,109 @@
 # keyword-buster.py
 import argparse
-import re
+import sys
+from contextlib import nullcontext
 
 from tabulate import tabulate
 
+from keyword_buster.cache import DEFAULT_CACHE_PATH, PatternCache
+from keyword_buster.dictionary import DEFAULT_DICTIONARY, FOLD_ACCENTS, FOLD_MODES, read_dictionary_words
+from keyword_buster.fuzzy import FUZZY_DISTANCES, FuzzyIndex
+from keyword_buster.layout import puzzle_layout
+from keyword_buster.matcher import match_patterns
+from keyword_buster.shared import match_patterns_parallel
+from keyword_buster.signature import SignatureIndex, parse_query
+from keyword_buster.solver import KeywordSolver
+
+
+def _compute_matching_words(word_list, pattern, signatures):
+    parsed = parse_query(pattern)
+    if parsed is None:
+        return word_list.match(pattern)
+    if signatures is None:
+        signatures = SignatureIndex(word_list)
+    return signatures.match(*parsed)
+
+
+def find_matching_words(word_list, pattern, signatures=None, cache=None):
+    """Find and return words that match the given pattern.
+
+    'anagram:LETTERS' and 'PATTERN+LETTERS' queries are answered from the signature index.
+    With a PatternCache, results are looked up by dictionary fingerprint and folded pattern first.
+    """
+    if cache is None:
+        return _compute_matching_words(word_list, pattern, signatures)
+    return cache.get_or_compute(word_list.fingerprint, word_list.fold_pattern(pattern),
+                                lambda: _compute_matching_words(word_list, pattern, signatures))
+
+
+def find_all_matching_words(word_list, patterns, cache=None, jobs=1, signatures=None):
+    """Find the matching words of many patterns, computing every cache miss in a single pass.
+
+    With jobs > 1 the misses are split across worker processes sharing one copy of the dictionary.
+    Signature queries share the given SignatureIndex, or one built on the first query that misses the cache.
+    """
+    results = {}
+    missing = []
+    missing_queries = []
+    for pattern in dict.fromkeys(patterns):
+        words = cache.get(word_list.fingerprint, word_list.fold_pattern(pattern)) if cache is not None else None
+        if words is not None:
+            results[pattern] = words
+        elif parse_query(pattern) is not None:
+            missing_queries.append(pattern)
+        else:
+            missing.append(pattern)
+
+    if missing_queries and signatures is None:
+        signatures = SignatureIndex(word_list)
+    computed = {pattern: _compute_matching_words(word_list, pattern, signatures) for pattern in missing_queries}
+    if jobs > 1:
+        computed.update(match_patterns_parallel(word_list, missing, jobs))
+    else:
+        computed.update(match_patterns(word_list, missing))
+    for pattern, words in computed.items():
+        if cache is not None:
+            cache.put(word_list.fingerprint, word_list.fold_pattern(pattern), words)
+        results[pattern] = words
+    if cache is not None:
+        cache.commit()
+    return results
+
+
+def read_puzzles(filepath):
+    """Read puzzles from a file with one space-separated puzzle per line, in uppercase."""
+    with open(filepath, 'r', encoding='utf-8') as file:
+        return [line.upper().split() for line in file if line.strip()]
+
+
+def print_puzzle(words_list, matches, fuzzy_matches=None):
+    """Print the '?'-aligned grid of a puzzle followed by each word's matches.
+
+    Fuzzy matches, when given, follow the exact ones as '~WORD (distance)'.
+    """
+    layout = puzzle_layout(words_list)
 
-def read_dictionary_words(filepath):
-    """Read words from the specified file and return them as a list in uppercase."""
-    with open(filepath, 'r') as file:
-        words = [word.strip().upper() for word in file]
-    return words
+    table_fmt = 'plain'
+    print(tabulate(layout.rows(), tablefmt=table_fmt))
+
+    for pattern in words_list:
+        print(f'{pattern}')
+        for word in matches[pattern]:
+            print(f'  {word}')
+        if fuzzy_matches is not None:
+            for word, distance in fuzzy_matches[pattern]:
+                if distance > 0:
+                    print(f'  ~{word} ({distance})')
 
 
-def find_matching_words(word_list, pattern):
-    """Find and return words that match the given pattern."""
-    regex_pattern = "^" + pattern.replace('?', '.') + "$"
-    regex = re.compile(regex_pattern)
-    return [word for word in word_list if regex.match(word)]
+def find_column_letters(word_list, pattern, matching_words):
+    """Return the set of folded letters that fill the first '?' of the pattern in its matching words."""
+    folded_pattern = word_list.fold_pattern(pattern)
+    if '?' not in folded_pattern:
+        return set()
+    q_index = folded_pattern.index('?')
+    folded_words = (word_list.fold_pattern(word) for word in matching_words)
+    return {word[q_index] for word in folded_words if len(word) > q_index}
 
 
 def main():
@@ -24,73 +111,104 @@ def main():
         description="Align '?' characters in the provided words and print the longest word with additional details.")
 
     # Adding argument definitions
-    parser.add_argument('words', metavar='WORD', type=str, nargs='+',
+    parser.add_argument('words', metavar='WORD', type=str, nargs='*',
                         help='Words to be added to the list and evaluated')
+    parser.add_argument('--puzzles',
+                        help='File with one space-separated puzzle per line, solved as a batch')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Worker processes used to match patterns, sharing one copy of the dictionary')
+    parser.add_argument('--dictionary', default=DEFAULT_DICTIONARY,
+                        help='Dictionary file with one word per line, optionally .gz, .bz2 or .xz compressed')
+    parser.add_argument('--encoding', default='utf-8',
+                        help='Text encoding of the dictionary file')
+    parser.add_argument('--fold', choices=FOLD_MODES, default=FOLD_ACCENTS,
+                        help='How dictionary words and patterns are folded before matching')
+    parser.add_argument('--query', action='append', default=[],
+                        help="Extra 'anagram:LETTERS' or 'PATTERN+LETTERS' query (repeatable)")
+    parser.add_argument('--keyword-letters',
+                        help="Letters of the keyword in any order; prints the arrangements that fit the '?' column")
+    parser.add_argument('--fuzzy', type=int, choices=FUZZY_DISTANCES, metavar='K',
+                        help='Also print words within K (1 or 2) edits of each pattern, to cope with typos; '
+                             'the index is rebuilt on every run for just these patterns, which on a 370k-word '
+                             'dictionary takes 1-2s at K=1 and 4s (short words) to 15s (long words) at K=2')
+    parser.add_argument('--keyword', action='store_true',
+                        help="Print the words and phrases that can be read down the '?' column")
+    parser.add_argument('--max-segments', type=int, default=3,
+                        help='Most words in a keyword phrase')
+    parser.add_argument('--min-word-length', type=int, default=2,
+                        help="Shortest word in a keyword phrase (the default 2 leaves out 'A' and 'I')")
+    parser.add_argument('--max-results', type=int, default=20,
+                        help='Most keyword phrases printed per puzzle')
+    parser.add_argument('--cache', default=DEFAULT_CACHE_PATH,
+                        help='sqlite file caching pattern results across runs')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Recompute every pattern instead of using the result cache')
+    parser.add_argument('--cache-stats', action='store_true',
+                        help='Print cache hit/miss statistics to stderr')
 
     # Parsing the arguments
     args = parser.parse_args()
+    if bool(args.words) == bool(args.puzzles):
+        parser.error('give either WORD arguments or --puzzles')
+    if args.puzzles and args.keyword_letters:
+        parser.error('--keyword-letters needs a single puzzle given as WORD arguments')
+    if args.keyword_letters and len(args.keyword_letters) != len(args.words):
+        parser.error('--keyword-letters needs exactly one letter per WORD')
 
     # Reading words from the dictionary file
-    dictionary_file = '/srv/dict/words_alpha.txt'
-    word_list = read_dictionary_words(dictionary_file)
-
-    # Adding words to a list and converting to uppercase
-    words_list = [word.upper() for word in args.words]
-
-    # Find the maximum index of '?'
-    max_q_index = max(word.index('?') for word in words_list)
-
-    # Prepend spaces to align all '?' characters on the same row
-    aligned_words_list = []
-    for word in words_list:
-        current_q_index = word.index('?')
-        prepend_spaces = max_q_index - current_q_index
-        aligned_word = ' ' * prepend_spaces + word
-        aligned_words_list.append(aligned_word)
-
-    # Counting the number of words
-    words_count = len(aligned_words_list)
-
-    # Finding the longest word
-    longest_word = max(aligned_words_list, key=len)
-
-    # Creating an array with longest_word rows and words_count columns
-    rows_count = len(longest_word)
-    array = [['' for _ in range(words_count)] for _ in range(rows_count)]
-
-    # Populating the array with characters from each word
-    for col in range(words_count):
-        for row in range(len(aligned_words_list[col])):
-            array[row][col] = aligned_words_list[col][row]
-
-    # # Printing the longest word and its length
-    # print(f"The longest word is: {longest_word.strip()}")
-    # print(f"Length of the longest word: {len(longest_word.strip())}")
-    #
-    # # Printing the total number of words
-    # print(f"Total number of words: {words_count}")
-    #
-    # # Printing all the aligned words
-    # print("\nAll provided words (aligned):")
-    # for word in aligned_words_list:
-    #     print(word)
-    #
-    # # Printing the array using tabulate
-    # print("\nArray Representation:")
-    table_fmt = 'grid'
-    table_fmt = 'plain'
-    print(tabulate(array, tablefmt=table_fmt))
-
-    # Processing each command line argument
-    for pattern in words_list:
-        matching_words = find_matching_words(word_list, pattern)
-
-        # Printing the results
-        # print(f"\nPattern: {pattern}")
-        print(f'{pattern}')
-        # print("Matching words:")
-        for word in matching_words:
-            print(f'  {word}')
+    try:
+        word_list = read_dictionary_words(args.dictionary, args.fold, args.encoding)
+    except ValueError as error:
+        parser.error(str(error))
+
+    # Pending cache entries are committed per batch and on exit, even when solving fails
+    with nullcontext() if args.no_cache else PatternCache(args.cache) as cache:
+        # Adding words to a list and converting to uppercase
+        if args.puzzles:
+            puzzles = read_puzzles(args.puzzles)
+        else:
+            puzzles = [[word.upper() for word in args.words]]
+
+        # Built once and shared by every signature query, in the puzzles or given with --query
+        signatures = SignatureIndex(word_list) if args.query or args.keyword_letters else None
+
+        # Matching every pattern of every puzzle in one pass over the dictionary
+        patterns = [pattern for puzzle in puzzles for pattern in puzzle]
+        matches = find_all_matching_words(word_list, patterns, cache, args.jobs, signatures)
+
+        solver = KeywordSolver(word_list) if args.keyword else None
+
+        # Indexes only the words and deletes this run's patterns can reach
+        fuzzy_index = FuzzyIndex(word_list, args.fuzzy, patterns) if args.fuzzy else None
+
+        for words_list in puzzles:
+            fuzzy_matches = None
+            if fuzzy_index is not None:
+                fuzzy_matches = {pattern: fuzzy_index.match(pattern) for pattern in words_list}
+            print_puzzle(words_list, matches, fuzzy_matches)
+
+            if solver is not None:
+                column_letters = [find_column_letters(word_list, pattern, matches[pattern]) for pattern in words_list]
+                print('Keyword')
+                for phrase in solver.segment(column_letters, args.max_segments, args.max_results,
+                                             args.min_word_length):
+                    print(f"  {' '.join(phrase)}")
+
+        for query in args.query:
+            print(f'{query.upper()}')
+            for word in find_matching_words(word_list, query, signatures, cache):
+                print(f'  {word}')
+        if cache is not None:
+            cache.commit()
+
+        if args.keyword_letters:
+            column_letters = [find_column_letters(word_list, pattern, matches[pattern]) for pattern in puzzles[0]]
+            print(f'Keyword arrangements of {args.keyword_letters.upper()}')
+            for word in signatures.arrangements(args.keyword_letters, column_letters):
+                print(f'  {word}')
+
+        if cache is not None and args.cache_stats:
+            print(cache.format_stats(), file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -5,6 +5,9 @@ from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QGridLayout, QLa
 from PyQt6.QtGui import QFont, QColor, QPalette
 from PyQt6.QtCore import Qt
 
+from keyword_buster.dictionary import DEFAULT_DICTIONARY, read_dictionary_words
+from keyword_buster.layout import puzzle_layout
+
 # Initialize logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -19,15 +22,12 @@ class GridApp(QMainWindow):
         self.dict_words = dict_words
         self.arg_words = [word.upper() for word in arg_words]
 
-        # Align the words vertically within the constructor
-        self.arg_words_aligned = self._align_words(self.arg_words)
-
-        # Generate the column-major order aligned array
-        self.cli_args_aligned_array = self._create_cli_args_aligned_array(self.arg_words_aligned)
+        # Align the words vertically on their '?' characters
+        self.layout = puzzle_layout(self.arg_words)
 
-        # Determine the dimensions of the aligned array
-        self.cli_args_longest = len(self.cli_args_aligned_array)
-        self.cli_args_count = len(self.cli_args_aligned_array[0]) if self.cli_args_aligned_array else 0
+        # Determine the dimensions of the aligned grid
+        self.cli_args_longest = self.layout.row_count
+        self.cli_args_count = self.layout.column_count
 
         self.setWindowTitle("Grid Navigation")
         self.setGeometry(100, 100, 800, 600)
@@ -58,54 +58,6 @@ class GridApp(QMainWindow):
 
         self.update_selection()
 
-    def _align_words(self, arg_words):
-        """Align words vertically such that all '?' align in the same row."""
-        if not arg_words:
-            return []
-
-        max_index = max(word.index('?') for word in arg_words if '?' in word)
-        max_length = max(map(len, arg_words))
-
-        aligned_words = []
-
-        for word in arg_words:
-            before_question = word[:word.index('?')]
-            after_question = word[word.index('?') + 1:]
-
-            # Create aligned string maintaining the same length
-            padded_word = ' ' * (max_index - len(before_question)) + word + ' ' * (
-                    max_length - len(after_question) - len(word[:word.index('?') + 1]))
-            aligned_words.append(padded_word)
-
-        for word in aligned_words:
-            logger.debug(f"Aligned word: {word}")
-
-        return aligned_words
-
-    def _create_cli_args_aligned_array(self, arg_words_aligned):
-        """Create a column-major order array from the aligned CLI arguments."""
-        cli_args_longest = max(map(len, arg_words_aligned), default=0)
-        cli_args_count = len(arg_words_aligned)
-
-        # Initialize empty 2D array
-        cli_args_aligned_array = [[" " for _ in range(cli_args_count)] for _ in range(cli_args_longest)]
-
-        # Populate the array in column-major order
-        for c in range(cli_args_count):
-            word = arg_words_aligned[c]
-            for r in range(cli_args_longest):
-                if r < len(word):
-                    cli_args_aligned_array[r][c] = word[r]
-                else:
-                    cli_args_aligned_array[r][c] = " "
-
-        # Log the array for debugging purposes
-        logger.debug("CLI Arguments Aligned Array (Column-Major Order):")
-        for row in cli_args_aligned_array:
-            logger.debug("".join(row))
-
-        return cli_args_aligned_array
-
     def create_grids(self):
         """Create and populate labels for both upper and lower grids."""
         for c in range(self.cli_args_count):
@@ -119,7 +71,7 @@ class GridApp(QMainWindow):
                 palette.setColor(QPalette.ColorRole.WindowText, QColor(FG_COLOUR))
                 palette.setColor(QPalette.ColorRole.Window, QColor(BG_COLOUR))
                 self.upper_grid[r][c].setPalette(palette)
-                self.upper_grid[r][c].setText(self.cli_args_aligned_array[r][c])
+                self.upper_grid[r][c].setText(self.layout.cell(r, c))
                 self.upper_grid[r][c].setStyleSheet(f"background-color: {BG_COLOUR}; color: {FG_COLOUR};")
                 self.upper_grid_layout.addWidget(self.upper_grid[r][c], r, c)
 
@@ -186,12 +138,9 @@ class GridApp(QMainWindow):
             logger.debug(f"Current word in column {current_column}: {current_word}")
 
 
-def read_words_from_file(file_path):
-    """Reads words from a file and returns them as a list."""
-    with open(file_path, 'r') as file:
-        words = file.read().splitlines()
-    words = [word.upper() for word in words]
-    return words
+def read_words_from_file(file_path, encoding='utf-8'):
+    """Reads words from a file in the given encoding and returns them as a folded WordIndex."""
+    return read_dictionary_words(file_path, encoding=encoding)
 
 
 def main():
@@ -201,7 +150,7 @@ def main():
     args = parser.parse_args()
 
     # Read words from the file
-    dict_words = read_words_from_file('/srv/dict/words_alpha.txt')
+    dict_words = read_words_from_file(DEFAULT_DICTIONARY)
 
     # Create and run the application
     app = QApplication(sys.argv)
@@ -5,6 +5,9 @@ from textual.app import App, ComposeResult
 from textual.containers import Vertical, Horizontal
 from textual.widgets import Static
 
+from keyword_buster.dictionary import DEFAULT_DICTIONARY, read_dictionary_words
+from keyword_buster.layout import puzzle_layout
+
 # Initialize logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -23,67 +26,16 @@ class GridApp(App):
         self.dict_words = dict_words
         self.arg_words = [word.upper() for word in arg_words]
 
-        # Align the words vertically within the constructor
-        self.arg_words_aligned = self._align_words(self.arg_words)
-
-        # Generate the column-major order aligned array
-        self.cli_args_aligned_array = self._create_cli_args_aligned_array(self.arg_words_aligned)
+        # Align the words vertically on their '?' characters
+        self.layout = puzzle_layout(self.arg_words)
 
-        # Determine the dimensions of the aligned array
-        self.cli_args_longest = len(self.cli_args_aligned_array) if self.cli_args_aligned_array else 0
-        self.cli_args_count = len(self.cli_args_aligned_array[0]) if self.cli_args_longest > 0 else 0
+        # Determine the dimensions of the aligned grid
+        self.cli_args_longest = self.layout.row_count
+        self.cli_args_count = self.layout.column_count
 
         self.selected_grid = 1
         self.current_cell = [0, 0]
 
-    def _align_words(self, arg_words):
-        """Align words vertically such that all '?' align in the same row."""
-        if not arg_words:
-            return []
-
-        max_index = max(word.index('?') for word in arg_words if '?' in word)
-        max_length = max(map(len, arg_words))
-
-        aligned_words = []
-
-        for word in arg_words:
-            before_question = word[:word.index('?')]
-            after_question = word[word.index('?') + 1:]
-
-            # Create aligned string maintaining the same length
-            padded_word = ' ' * (max_index - len(before_question)) + word + ' ' * (
-                    max_length - len(after_question) - len(word[:word.index('?') + 1]))
-            aligned_words.append(padded_word)
-
-        for word in aligned_words:
-            logger.debug(f"Aligned word: {word}")
-
-        return aligned_words
-
-    def _create_cli_args_aligned_array(self, arg_words_aligned):
-        """Create a column-major order array from the aligned CLI arguments."""
-        cli_args_longest = max(map(len, arg_words_aligned), default=0)
-        cli_args_count = len(arg_words_aligned)
-
-        # Initialize empty 2D array
-        cli_args_aligned_array = [[" " for _ in range(cli_args_count)] for _ in range(cli_args_longest)]
-
-        # Populate the array in column-major order
-        for c in range(cli_args_count):
-            word = arg_words_aligned[c]
-            for r in range(cli_args_longest):
-                if r < len(word):
-                    cli_args_aligned_array[r][c] = word[r]
-                else:
-                    cli_args_aligned_array[r][c] = ' '
-
-        # Log the array for debugging purposes
-        logger.debug("CLI Arguments Aligned Array (Column-Major Order):")
-        for row in cli_args_aligned_array:
-            logger.debug("".join(row))
-
-        return cli_args_aligned_array
-
     def compose(self) -> ComposeResult:
         """Create and populate labels for both upper and lower grids."""
         upper_grid_container = Vertical(id="upper-grid")
@@ -97,21 +49,21 @@ class GridApp(App):
         self.lower_grid = [[None for _ in range(self.cli_args_count)] for _ in range(8)]
 
         upper_grid_container.mount(self._create_grid(self.upper_grid, self.cli_args_longest, self.cli_args_count,
-                                                     self.cli_args_aligned_array))
+                                                     self.layout.cell))
 
-        lower_grid_container.mount(self._create_grid(self.lower_grid, 8, self.cli_args_count, self.arg_words))
+        lower_grid_container.mount(self._create_grid(self.lower_grid, 8, self.cli_args_count,
+                                                     lambda r, c: self.arg_words[c] if r == 0 else ""))
 
         self.update_selection()
 
-    def _create_grid(self, grid, row_count, column_count, content):
-        """Create a grid with specified rows, columns, and content."""
+    def _create_grid(self, grid, row_count, column_count, cell_content):
+        """Create a grid with specified rows, columns, and a cell_content(r, c) callback."""
         container = Vertical()
         for r in range(row_count):
             row = Horizontal()
             container.mount(row)
             for c in range(column_count):
-                cell_content = content[r][c] if isinstance(content[0], list) else (content[c] if r == 0 else "")
-                grid[r][c] = Static(cell_content, classes="grid-cell")
+                grid[r][c] = Static(cell_content(r, c), classes="grid-cell")
                 row.mount(grid[r][c])
         return container
 
@@ -159,12 +111,9 @@ class GridApp(App):
             logger.debug(f"Current word in column {current_column}: {current_word}")
 
 
-def read_words_from_file(file_path):
-    """Reads words from a file and returns them as a list."""
-    with open(file_path, 'r') as file:
-        words = file.read().splitlines()
-    words = [word.upper() for word in words]
-    return words
+def read_words_from_file(file_path, encoding='utf-8'):
+    """Reads words from a file in the given encoding and returns them as a folded WordIndex."""
+    return read_dictionary_words(file_path, encoding=encoding)
 
 
 def main():
@@ -174,7 +123,7 @@ def main():
     args = parser.parse_args()
 
     # Read words from the file
-    dict_words = read_words_from_file('/srv/dict/words_alpha.txt')
+    dict_words = read_words_from_file(DEFAULT_DICTIONARY)
 
     # Create and run the application
     app = GridApp(dict_words, args.words)
@@ -0,0 +1,75 @@
+from collections import Counter
+
+
+def _build_dispatch_table(patterns):
+    """Index same-length patterns by one of their fixed letters.
+
+    Each pattern is keyed on the fixed position shared by the most patterns, so a
+    word only has to be probed at a handful of positions. Returns the table
+    ({position: {letter: [(pattern, checks)]}}) and the all-wildcard patterns.
+    """
+    popularity = Counter(position for pattern in patterns
+                         for position, ch in enumerate(pattern) if ch != '?')
+    table = {}
+    wildcard_only = []
+    for pattern in patterns:
+        fixed = [(position, ch) for position, ch in enumerate(pattern) if ch != '?']
+        if not fixed:
+            wildcard_only.append(pattern)
+            continue
+        key_position, key_letter = max(fixed, key=lambda item: popularity[item[0]])
+        checks = tuple(item for item in fixed if item[0] != key_position)
+        table.setdefault(key_position, {}).setdefault(key_letter, []).append((pattern, checks))
+    return table, wildcard_only
+
+
+def match_bucket(entries, patterns):
+    """Match same-length folded patterns in one pass over (key, folded word) entries.
+
+    Returns {pattern: [keys]}. The cost of the pass is proportional to the number
+    of entries plus the number of matches, not to patterns x entries.
+    """
+    results = {pattern: [] for pattern in patterns}
+    table, wildcard_only = _build_dispatch_table(list(results))
+    probes = list(table.items())
+    wildcard_results = [results[pattern] for pattern in wildcard_only]
+    for key, word in entries:
+        for position, letters in probes:
+            for pattern, checks in letters.get(word[position], ()):
+                for check_position, ch in checks:
+                    if word[check_position] != ch:
+                        break
+                else:
+                    results[pattern].append(key)
+        for matches in wildcard_results:
+            matches.append(key)
+    return results
+
+
+def group_by_length(patterns):
+    """Return {length: [patterns]} for the distinct patterns."""
+    by_length = {}
+    for pattern in dict.fromkeys(patterns):
+        by_length.setdefault(len(pattern), []).append(pattern)
+    return by_length
+
+
+def match_pattern_ids(word_index, patterns):
+    """Match many folded patterns in one pass over each length bucket of the index.
+
+    Returns {pattern: [word ids]}.
+    """
+    folded = word_index.folded
+    results = {}
+    for length, length_patterns in group_by_length(patterns).items():
+        entries = ((i, folded[i]) for i in word_index.by_length.get(length, ()))
+        results.update(match_bucket(entries, length_patterns))
+    return results
+
+
+def match_patterns(word_index, patterns):
+    """Match many patterns at once and return {pattern: [original spellings]}."""
+    folded_patterns = {pattern: word_index.fold_pattern(pattern) for pattern in patterns}
+    ids = match_pattern_ids(word_index, set(folded_patterns.values()))
+    words = word_index.words
+    return {pattern: [words[i] for i in ids[folded]] for pattern, folded in folded_patterns.items()}
@@ -0,0 +1,141 @@
+import json
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from keyword_buster.dictionary import fold_word
+from keyword_buster.matcher import group_by_length, match_bucket
+
+_HEADER_SIZE = struct.Struct('<Q')  # Length of the JSON directory that follows it
+
+_worker_index = None  # SharedWordIndex attached by each pool worker
+
+
+class SharedDictionary:
+    """Publishes a WordIndex once into shared memory for process-pool workers.
+
+    Each length bucket is stored as alternating FOLDED and ORIGINAL lines, after a
+    small JSON directory of bucket offsets; a dictionary word never holds a
+    newline, whatever other characters it contains. The publisher owns the block
+    and unlinks it on close; workers attach read-only with SharedWordIndex.
+    """
+
+    def __init__(self, word_index):
+        buckets = []
+        directory = {'fold': word_index.fold, 'fingerprint': word_index.fingerprint, 'buckets': {}}
+        offset = 0
+        for length, ids in sorted(word_index.by_length.items()):
+            blob = ''.join(f'{word_index.folded[i]}\n{word_index.words[i]}\n' for i in ids).encode('utf-8')
+            directory['buckets'][str(length)] = [offset, len(blob)]
+            buckets.append(blob)
+            offset += len(blob)
+
+        header = json.dumps(directory).encode('utf-8')
+        data_start = _HEADER_SIZE.size + len(header)
+        self.shm = shared_memory.SharedMemory(create=True, size=max(data_start + offset, 1))
+        self.name = self.shm.name
+
+        buf = self.shm.buf
+        _HEADER_SIZE.pack_into(buf, 0, len(header))
+        buf[_HEADER_SIZE.size:data_start] = header
+        position = data_start
+        for blob in buckets:
+            buf[position:position + len(blob)] = blob
+            position += len(blob)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Release and unlink the shared block."""
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+
+class SharedWordIndex:
+    """Read-only view of a dictionary published by SharedDictionary.
+
+    Attaching only parses the JSON header and copies no word. Matching decodes
+    one length bucket into a temporary local copy and runs the same single-pass
+    dispatch-table matcher as the in-process path over it, so a worker holds at
+    most one bucket's words at a time.
+    """
+
+    def __init__(self, name):
+        self.shm = shared_memory.SharedMemory(name=name)
+        buf = self.shm.buf
+        (header_size,) = _HEADER_SIZE.unpack_from(buf, 0)
+        data_start = _HEADER_SIZE.size + header_size
+        directory = json.loads(bytes(buf[_HEADER_SIZE.size:data_start]))
+        self.fold = directory['fold']
+        self.fingerprint = directory['fingerprint']
+        self.buckets = {int(length): buf[data_start + offset:data_start + offset + size]
+                        for length, (offset, size) in directory['buckets'].items()}
+
+    def fold_pattern(self, pattern):
+        """Fold a query pattern the same way the published dictionary was folded."""
+        return fold_word(pattern, self.fold)
+
+    def entries(self, length):
+        """Yield (original spelling, folded word) pairs of one length bucket."""
+        bucket = self.buckets.get(length)
+        if bucket is None:
+            return
+        # Split on '\n' only: str.splitlines() also breaks at U+0085, U+2028 and the like
+        lines = bytes(bucket).decode('utf-8').split('\n')
+        yield from zip(lines[1::2], lines[0::2])
+
+    def match_bucket(self, length, folded_patterns):
+        """Match folded patterns of one length in a single pass; returns {pattern: [original spellings]}."""
+        return match_bucket(self.entries(length), folded_patterns)
+
+    def match_patterns(self, patterns):
+        """Match many patterns and return {pattern: [original spellings]}."""
+        folded_patterns = {pattern: self.fold_pattern(pattern) for pattern in patterns}
+        results = {}
+        for length, length_patterns in group_by_length(folded_patterns.values()).items():
+            results.update(self.match_bucket(length, length_patterns))
+        return {pattern: results[folded] for pattern, folded in folded_patterns.items()}
+
+    def close(self):
+        """Detach from the shared block (the publisher unlinks it)."""
+        self.buckets = {}
+        self.shm.close()
+
+
+def attach_worker(name):
+    """Process-pool initializer attaching the worker to a published dictionary."""
+    global _worker_index
+    _worker_index = SharedWordIndex(name)
+
+
+def match_bucket_in_worker(task):
+    """Match one (length, folded patterns) task against the dictionary this worker attached to."""
+    length, folded_patterns = task
+    return _worker_index.match_bucket(length, folded_patterns)
+
+
+def match_patterns_parallel(word_index, patterns, jobs):
+    """Match patterns across a pool of workers sharing one published copy of the dictionary.
+
+    Work is split by length bucket, and each bucket is matched in a single pass
+    for all of its patterns, as in match_patterns.
+    """
+    folded_patterns = {pattern: word_index.fold_pattern(pattern) for pattern in patterns}
+    if not folded_patterns:
+        return {}
+    # Largest buckets first, so the pool is not left waiting on one big bucket at the end
+    tasks = sorted(group_by_length(folded_patterns.values()).items(),
+                   key=lambda task: len(word_index.by_length.get(task[0], ())), reverse=True)
+    results = {}
+    with SharedDictionary(word_index) as shared:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks)), initializer=attach_worker,
+                                 initargs=(shared.name,)) as pool:
+            for bucket_results in pool.map(match_bucket_in_worker, tasks):
+                results.update(bucket_results)
+    return {pattern: results[folded] for pattern, folded in folded_patterns.items()}
@@ -0,0 +1,121 @@
+import re
+
+ANAGRAM_PREFIX = 'anagram:'
+MULTISET_SEPARATOR = '+'
+
+
+def letter_signature(letters):
+    """Return the sorted-letter signature shared by all arrangements of the letters."""
+    return ''.join(sorted(letters))
+
+
+def parse_query(query):
+    """Split a signature query into (pattern, letters).
+
+    'anagram:LETTERS' becomes an all-wildcard pattern filled by LETTERS, and
+    'PATTERN+LETTERS' fills the pattern's '?' positions from LETTERS.
+    Returns None for plain patterns.
+    """
+    if query.lower().startswith(ANAGRAM_PREFIX):
+        letters = query[len(ANAGRAM_PREFIX):]
+        return '?' * len(letters), letters
+    if MULTISET_SEPARATOR in query:
+        pattern, letters = query.split(MULTISET_SEPARATOR, 1)
+        return pattern, letters
+    return None
+
+
+class SignatureIndex:
+    """Words of a WordIndex keyed by the sorted letters of their folded form.
+
+    Each signature also carries a per-letter count vector, so bag-of-letters
+    queries are a single dictionary lookup or a vector comparison per signature.
+    """
+
+    def __init__(self, word_index):
+        self.word_index = word_index
+        self.alphabet = ''.join(sorted(set().union(*word_index.folded)))
+        self._slots = {ch: i for i, ch in enumerate(self.alphabet)}
+        self.by_signature = {}  # Signature -> list of word ids
+        self.counts = {}  # Signature -> per-letter count vector over the alphabet
+        self.by_length = {}  # Length -> list of signatures
+
+        for i, folded in enumerate(word_index.folded):
+            signature = letter_signature(folded)
+            ids = self.by_signature.get(signature)
+            if ids is None:
+                ids = self.by_signature[signature] = []
+                self.counts[signature] = self.count_vector(signature)
+                self.by_length.setdefault(len(signature), []).append(signature)
+            ids.append(i)
+
+    def count_vector(self, letters):
+        """Return the per-letter counts of the letters, ignoring letters no word uses."""
+        vector = bytearray(len(self.alphabet))
+        for ch in letters:
+            slot = self._slots.get(ch)
+            if slot is not None:
+                vector[slot] = min(vector[slot] + 1, 255)
+        return bytes(vector)
+
+    def anagram_ids(self, letters):
+        """Return the ids of words that use exactly the given letters."""
+        letters = self.word_index.fold_pattern(letters)
+        return list(self.by_signature.get(letter_signature(letters), ()))
+
+    def anagrams(self, letters):
+        """Return the words that use exactly the given letters."""
+        return [self.word_index.words[i] for i in self.anagram_ids(letters)]
+
+    def match_ids(self, pattern, letters):
+        """Return the ids of words matching the pattern whose '?' positions are filled from letters.
+
+        When letters holds exactly one letter per '?' this is a single signature
+        lookup; spare letters fall back to comparing count vectors of the signatures
+        of the pattern's length.
+        """
+        pattern = self.word_index.fold_pattern(pattern)
+        letters = self.word_index.fold_pattern(letters)
+        fixed = pattern.replace('?', '')
+        blanks = len(pattern) - len(fixed)
+        if len(letters) < blanks:
+            return []
+
+        if len(letters) == blanks:
+            ids = self.by_signature.get(letter_signature(fixed + letters), ())
+        else:
+            available = self.count_vector(fixed + letters)
+            ids = []
+            for signature in self.by_length.get(len(pattern), ()):
+                if all(used <= limit for used, limit in zip(self.counts[signature], available)):
+                    ids.extend(self.by_signature[signature])
+
+        regex = re.compile(re.escape(pattern).replace(r'\?', '.'))
+        folded = self.word_index.folded
+        return [i for i in ids if regex.fullmatch(folded[i])]
+
+    def match(self, pattern, letters):
+        """Return the words matching the pattern whose '?' positions are filled from letters."""
+        return [self.word_index.words[i] for i in self.match_ids(pattern, letters)]
+
+    def query(self, query):
+        """Answer an 'anagram:LETTERS' or 'PATTERN+LETTERS' query."""
+        parsed = parse_query(query)
+        if parsed is None:
+            raise ValueError(f"Not a signature query: {query!r}")
+        return self.match(*parsed)
+
+    def arrangements(self, letters, column_letters=None):
+        """Return the words that arrange the letters, optionally restricted per position.
+
+        column_letters holds, for each position, the set of folded letters allowed
+        there (e.g. the candidates for each '?' of the puzzle), and must have one
+        entry per letter. No permutations are enumerated: the signature lookup
+        yields every arrangement at once.
+        """
+        ids = self.anagram_ids(letters)
+        if column_letters is not None:
+            folded = self.word_index.folded
+            ids = [i for i in ids if len(folded[i]) == len(column_letters)
+                   and all(ch in allowed for ch, allowed in zip(folded[i], column_letters))]
+        return [self.word_index.words[i] for i in ids]
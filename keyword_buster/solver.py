@@ -0,0 +1,105 @@
+_END = None  # Trie key marking the end of a word; never a letter
+
+
+def build_trie(word_index, max_length):
+    """Build a nested-dict trie of the folded words no longer than max_length.
+
+    Terminal nodes map _END to the original spelling of the first word with that folded form.
+    """
+    root = {}
+    words = word_index.words
+    for length, ids in word_index.by_length.items():
+        if length > max_length:
+            continue
+        for i in ids:
+            node = root
+            for ch in word_index.folded[i]:
+                node = node.setdefault(ch, {})
+            node.setdefault(_END, words[i])
+    return root
+
+
+class KeywordSolver:
+    """Splits a sequence of candidate letter sets into dictionary words.
+
+    Used on the '?' column of a puzzle, where each position may hold any of the
+    letters that complete its clue word, and the keyword may be a phrase.
+    """
+
+    def __init__(self, word_index):
+        self.word_index = word_index
+        self._trie = None
+        self._trie_length = 0
+
+    def _trie_for(self, length):
+        """Return a trie covering words up to length, rebuilding it only when it is too short."""
+        if self._trie is None or length > self._trie_length:
+            self._trie = build_trie(self.word_index, length)
+            self._trie_length = length
+        return self._trie
+
+    def segment(self, letter_sets, max_segments=3, max_results=50, min_word_length=2):
+        """Return segmentations of the letter-set sequence into dictionary words.
+
+        Each segmentation is a tuple of original spellings, fewest words first:
+        phrases of k words are only produced once those of fewer words did not
+        reach max_results, so the cap only ever drops the longer phrases. At most
+        max_segments words are used, each at least min_word_length letters long
+        (the default of 2 leaves out 'A' and 'I'), and every memoised suffix keeps
+        at most max_results entries, which bounds the work on long rows with many
+        candidate letters per position.
+        """
+        fold_pattern = self.word_index.fold_pattern
+        letter_sets = [{fold_pattern(ch) for ch in letters} for letters in letter_sets]
+        n = len(letter_sets)
+        if n == 0:
+            return []
+        trie = self._trie_for(n)
+        words_from = {}  # Start position -> [(end position, word)]
+        suffixes = {}  # (start position, segment count) -> segmentations of letter_sets[start:]
+
+        def find_words(start):
+            found = words_from.get(start)
+            if found is None:
+                found = []
+                stack = [(start, trie)]
+                while stack:
+                    position, node = stack.pop()
+                    word = node.get(_END)
+                    if word is not None and position - start >= min_word_length:
+                        found.append((position, word))
+                    if position < n:
+                        for ch in letter_sets[position]:
+                            child = node.get(ch)
+                            if child is not None:
+                                stack.append((position + 1, child))
+                found.sort(reverse=True)  # Longest words first
+                words_from[start] = found
+            return found
+
+        def suffix(start, segments):
+            """Segmentations of letter_sets[start:] into exactly this many words."""
+            if segments == 0:
+                return [()] if start == n else []
+            if n - start < segments * min_word_length:
+                return []
+            key = (start, segments)
+            results = suffixes.get(key)
+            if results is None:
+                results = []
+                for end, word in find_words(start):
+                    for rest in suffix(end, segments - 1):
+                        results.append((word,) + rest)
+                        if len(results) >= max_results:
+                            break
+                    if len(results) >= max_results:
+                        break
+                suffixes[key] = results
+            return results
+
+        segmentations = []
+        for segments in range(1, max_segments + 1):
+            segmentations.extend(suffix(0, segments)[:max_results - len(segmentations)])
+            if len(segmentations) >= max_results:
+                break
+        return segmentations
@@ -0,0 +1,65 @@
+from keyword_buster.cache import PatternCache, _entry_size
+
+
+def test_entries_persist_across_instances(tmp_path):
+    path = str(tmp_path / 'patterns.sqlite')
+    with PatternCache(path) as cache:
+        assert cache.get('fp', '?OG') is None
+        cache.put('fp', '?OG', ['DOG', 'LOG'])
+        cache.put('fp', 'ZZ?', [])
+
+    with PatternCache(path) as cache:
+        assert cache.get('fp', '?OG') == ['DOG', 'LOG']
+        assert cache.get('fp', 'ZZ?') == []
+        assert cache.get('other', '?OG') is None
+        assert cache.get('fp', '?OG') == ['DOG', 'LOG']
+        stats = cache.stats()
+    assert (stats['memory_hits'], stats['disk_hits'], stats['misses']) == (1, 2, 1)
+
+
+def test_get_or_compute_only_computes_misses():
+    calls = []
+    cache = PatternCache(None)
+    for _ in range(3):
+        assert cache.get_or_compute('fp', 'HA?', lambda: calls.append(1) or ['HAT']) == ['HAT']
+    assert len(calls) == 1
+
+
+def test_lru_evicts_least_recently_used_by_size():
+    first, second, third = ['A' * 50], ['B' * 50], ['C' * 50]
+    budget = _entry_size('P1', first) + _entry_size('P2', second)
+    cache = PatternCache(None, max_bytes=budget)
+    cache.put('fp', 'P1', first)
+    cache.put('fp', 'P2', second)
+    cache.get('fp', 'P1')  # P2 is now the least recently used
+    cache.put('fp', 'P3', third)
+    assert set(key[1] for key in cache.memory) == {'P1', 'P3'}
+    assert cache.memory_bytes == _entry_size('P1', first) + _entry_size('P3', third)
+    assert cache.memory_bytes <= budget
+
+
+def test_commit_releases_the_write_lock(tmp_path):
+    path = str(tmp_path / 'patterns.sqlite')
+    with PatternCache(path) as first, PatternCache(path) as second:
+        first._connection.execute('PRAGMA busy_timeout = 0')
+        second._connection.execute('PRAGMA busy_timeout = 0')
+        first.put('fp', 'A?', ['AB'])
+        first.commit()
+        second.put('fp', 'B?', ['BA'])
+        second.commit()
+        first.memory.clear()
+        assert first.get('fp', 'B?') == ['BA']
+
+
+def test_unusable_store_falls_back_to_memory(tmp_path, capsys):
+    not_a_directory = tmp_path / 'file'
+    not_a_directory.write_text('')
+    corrupt = tmp_path / 'corrupt.sqlite'
+    corrupt.write_bytes(b'not a database' * 100)
+
+    for path in (str(not_a_directory / 'patterns.sqlite'), str(corrupt)):
+        with PatternCache(path) as cache:
+            assert cache.path is None
+            cache.put('fp', '?OG', ['DOG'])
+            assert cache.get('fp', '?OG') == ['DOG']
+        assert 'caching in memory only' in capsys.readouterr().err
@@ -0,0 +1,49 @@
+import gzip
+
+import pytest
+
+from keyword_buster.dictionary import FOLD_CASE, FOLD_NONE, WordIndex, fold_word, read_dictionary_words
+
+
+def test_fold_word_strips_case_and_accents():
+    assert fold_word('café') == 'CAFE'
+    assert fold_word('straße') == 'STRASSE'
+    assert fold_word('café', FOLD_CASE) == 'CAFÉ'
+    assert fold_word('café', FOLD_NONE) == 'CAFÉ'
+
+
+def test_match_uses_folded_form_and_returns_original_spelling():
+    index = WordIndex(['café', 'Cafe', 'straße', 'dog\n', '', 'log'])
+    assert index.match('caf?') == ['café', 'Cafe']
+    assert index.match('STRASS?') == ['straße']
+    assert index.match('?OG') == ['dog', 'log']
+    assert index.match('????????') == []
+
+
+def test_match_without_accent_folding_keeps_accents_distinct():
+    index = WordIndex(['café', 'cafe'], FOLD_NONE)
+    assert index.match('CAFÉ') == ['café']
+
+
+def test_fingerprint_depends_on_words_and_fold():
+    assert WordIndex(['a', 'b']).fingerprint == WordIndex(['a', 'b']).fingerprint
+    assert WordIndex(['a', 'b']).fingerprint != WordIndex(['a', 'c']).fingerprint
+    assert WordIndex(['a']).fingerprint != WordIndex(['a'], FOLD_NONE).fingerprint
+
+
+def test_unknown_fold_mode_is_rejected():
+    with pytest.raises(ValueError):
+        WordIndex([], 'nope')
+
+
+def test_read_dictionary_words_handles_compression_and_encoding(tmp_path):
+    compressed = tmp_path / 'words.txt.gz'
+    with gzip.open(compressed, 'wt', encoding='utf-8') as file:
+        file.write('Müller\nmast\n')
+    assert read_dictionary_words(str(compressed)).match('MULL??') == ['Müller']
+
+    latin1 = tmp_path / 'latin1.txt'
+    latin1.write_bytes('Müller\n'.encode('latin-1'))
+    with pytest.raises(ValueError, match='latin-1'):
+        read_dictionary_words(str(latin1))
+    assert read_dictionary_words(str(latin1), encoding='latin-1').words == ['Müller']
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from keyword_buster.dictionary import WordIndex
+from keyword_buster.fuzzy import FuzzyIndex, deletes, edit_distance
+
+
+def reference_distance(pattern, word):
+    """Plain recursive optimal string alignment distance with '?' wildcards."""
+    memo = {}
+
+    def distance(i, j):
+        if (i, j) not in memo:
+            if i == 0 or j == 0:
+                memo[i, j] = i + j
+            else:
+                cost = 0 if pattern[i - 1] in ('?', word[j - 1]) else 1
+                best = min(distance(i - 1, j) + 1, distance(i, j - 1) + 1, distance(i - 1, j - 1) + cost)
+                if i > 1 and j > 1 and pattern[i - 1] == word[j - 2] and pattern[i - 2] == word[j - 1]:
+                    best = min(best, distance(i - 2, j - 2) + 1)
+                memo[i, j] = best
+        return memo[i, j]
+
+    return distance(len(pattern), len(word))
+
+
+def test_edit_distance_counts_missing_extra_and_swapped_letters():
+    assert edit_distance('TEACH', 'TEACH', 1) == 0
+    assert edit_distance('TEA?H', 'TEACH', 1) == 0
+    assert edit_distance('TECH', 'TEACH', 1) == 1
+    assert edit_distance('TEACHX', 'TEACH', 1) == 1
+    assert edit_distance('TAECH', 'TEACH', 1) == 1
+    assert edit_distance('TACEH', 'TEACH', 1) == 2
+    assert edit_distance('XYZ', 'TEACH', 1) == 2
+
+
+def test_edit_distance_agrees_with_reference():
+    rng = random.Random(11)
+    for _ in range(500):
+        pattern = ''.join(rng.choice('AB?') for _ in range(rng.randint(0, 6)))
+        word = ''.join(rng.choice('ABC') for _ in range(rng.randint(0, 6)))
+        expected = reference_distance(pattern, word)
+        for limit in (1, 2):
+            assert edit_distance(pattern, word, limit) == min(expected, limit + 1), (pattern, word)
+
+
+def test_deletes():
+    assert deletes('ABC', 1) == {'ABC', 'BC', 'AC', 'AB'}
+    assert deletes('AB', 2) == {'AB', 'A', 'B', ''}
+
+
+@pytest.mark.parametrize('max_distance', [1, 2])
+def test_fuzzy_lookup_matches_brute_force(max_distance):
+    rng = random.Random(max_distance)
+    words = [''.join(rng.choice('ABCDE') for _ in range(rng.randint(1, 6))) for _ in range(800)]
+    index = WordIndex(words)
+    fuzzy = FuzzyIndex(index, max_distance)
+    patterns = [''.join(rng.choice('ABCDE?') for _ in range(rng.randint(1, 6))) for _ in range(60)]
+    patterns.append('A???B')  # More wildcards than are expanded
+    limited = FuzzyIndex(index, max_distance, patterns[:10] + ['A???B'])
+    assert len(limited.by_delete) < len(fuzzy.by_delete)
+    for pattern in patterns:
+        distances = [reference_distance(pattern, word) for word in index.folded]
+        for distance in range(max_distance + 1):
+            expected = [(i, found) for i, found in enumerate(distances) if found <= distance]
+            assert sorted(fuzzy.match_ids(pattern, distance)) == expected, pattern
+            if pattern in limited.patterns:
+                assert sorted(limited.match_ids(pattern, distance)) == expected, pattern
+
+
+def test_distance_limits_are_enforced():
+    index = WordIndex(['AB'])
+    with pytest.raises(ValueError):
+        FuzzyIndex(index, 3)
+    with pytest.raises(ValueError):
+        FuzzyIndex(index, 1).match('AB', 2)
+    with pytest.raises(ValueError):
+        FuzzyIndex(index, 1, ['A?']).match('AB')
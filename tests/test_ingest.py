@@ -0,0 +1,82 @@
+import bz2
+import gzip
+import lzma
+import os
+import random
+
+import pytest
+
+from keyword_buster import ingest as ingest_module
+from keyword_buster.dictionary import read_dictionary_words
+from keyword_buster.ingest import MERGE_FAN_IN, ingest, normalise_word, sorted_runs
+
+
+def write_inputs(tmp_path, words):
+    """Spread the words over a gzip, a bz2 and an xz input with mixed case and blank lines."""
+    third = len(words) // 3
+    paths = [str(tmp_path / 'a.txt.gz'), str(tmp_path / 'b.txt.bz2'), str(tmp_path / 'c.txt.xz')]
+    with gzip.open(paths[0], 'wt', encoding='utf-8') as file:
+        file.write('\n'.join(words[:2 * third]))
+    with bz2.open(paths[1], 'wt', encoding='utf-8') as file:
+        file.write('\n'.join(word.upper() for word in words[third:]))
+    with lzma.open(paths[2], 'wt', encoding='utf-8') as file:
+        file.write('\n\n  '.join(words[third:]))
+    return paths
+
+
+def random_words(count, seed):
+    rng = random.Random(seed)
+    return [''.join(rng.choice('abcdefgh') for _ in range(rng.randint(1, 6))) for _ in range(count)]
+
+
+def test_normalise_word_composes_and_uppercases():
+    assert normalise_word('  café\n') == normalise_word('CAFÉ') == 'CAFÉ'
+    assert normalise_word('   \n') == ''
+
+
+def test_ingest_sorts_and_deduplicates_in_one_run(tmp_path):
+    words = random_words(3000, seed=1)
+    output = str(tmp_path / 'out.txt')
+    count, skipped = ingest(write_inputs(tmp_path, words), output)
+    expected = sorted({word.upper() for word in words})
+    with open(output, encoding='utf-8') as file:
+        assert file.read().splitlines() == expected
+    assert (count, skipped) == (len(expected), 0)
+
+
+def test_ingest_merges_more_runs_than_the_fan_in(tmp_path, monkeypatch):
+    words = random_words(20000, seed=2)
+    paths = write_inputs(tmp_path, words)
+    runs, _ = sorted_runs(paths, 2000, str(tmp_path))
+    assert len(runs) > MERGE_FAN_IN
+
+    monkeypatch.setattr(ingest_module, 'MERGE_FAN_IN', 4)
+    output = str(tmp_path / 'out.txt.gz')
+    count, _ = ingest(paths, output, memory_mb=2000 / (1024 * 1024))
+    expected = sorted({word.upper() for word in words})
+    assert read_dictionary_words(output).words == expected
+    assert count == len(expected)
+    assert not any(name.startswith('.partial-') for name in os.listdir(tmp_path))
+
+
+def test_ingest_skips_undecodable_lines_and_merges_nfc_forms(tmp_path):
+    source = tmp_path / 'mixed.txt'
+    source.write_bytes('caf\u00e9\ncafe\u0301\nCAF\u00c9\ncafe\n'.encode('utf-8') + b'bad\xff\nok\n')
+    output = str(tmp_path / 'out.txt')
+    assert ingest([str(source)], output) == (3, 1)
+    with open(output, encoding='utf-8') as file:
+        assert file.read().splitlines() == ['CAFE', 'CAFÉ', 'OK']
+
+
+def test_failed_merge_removes_the_partial_output(tmp_path, monkeypatch):
+    source = tmp_path / 'words.txt'
+    source.write_text('a\nb\n', encoding='utf-8')
+
+    def failing_merge(paths, output):
+        output.write('A\n')
+        raise RuntimeError('disk full')
+
+    monkeypatch.setattr(ingest_module, '_merge_unique', failing_merge)
+    with pytest.raises(RuntimeError):
+        ingest([str(source)], str(tmp_path / 'out.txt'))
+    assert sorted(os.listdir(tmp_path)) == ['words.txt']
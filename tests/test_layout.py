@@ -0,0 +1,43 @@
+from keyword_buster.layout import PuzzleLayout, puzzle_layout
+
+
+def naive_grid(words):
+    """Reference alignment: pad each word so its '?' lands on the keyword row."""
+    anchors = [word.index('?') if '?' in word else None for word in words]
+    keyword_row = max((anchor for anchor in anchors if anchor is not None), default=0)
+    aligned = [' ' * (0 if anchor is None else keyword_row - anchor) + word for word, anchor in zip(words, anchors)]
+    rows = max(map(len, aligned), default=0)
+    return [[word[r] if r < len(word) else ' ' for word in aligned] for r in range(rows)]
+
+
+def test_layout_aligns_question_marks_on_one_row():
+    words = ['MI?S', 'TEA?H', 'A?YHOW']
+    layout = PuzzleLayout(words)
+    assert (layout.row_count, layout.column_count, layout.keyword_row) == (8, 3, 3)
+    assert layout.rows() == naive_grid(words)
+    assert layout.row_text(layout.keyword_row) == '???'
+    assert layout.column_text(1) == 'TEA?H   '
+    assert layout.cell(2, 2) == 'A'
+
+
+def test_views_share_the_grid_buffer():
+    layout = PuzzleLayout(['AB?', '?CD'])
+    row = layout.row(3)
+    column = layout.column(0)
+    assert row.obj is column.obj
+    assert [chr(code) for code in row] == [' ', 'C']
+    assert [chr(code) for code in column] == ['A', 'B', '?', ' ', ' ']
+
+
+def test_words_without_question_mark_and_empty_puzzles():
+    words = ['DOG', 'H?T', 'Ü?ER']
+    layout = PuzzleLayout(words)
+    assert layout.q_indexes == (None, 1, 1)
+    assert layout.rows() == naive_grid(words)
+    assert PuzzleLayout([]).rows() == []
+    assert PuzzleLayout(['DOG']).rows() == naive_grid(['DOG'])
+
+
+def test_layouts_are_memoised_per_puzzle():
+    assert puzzle_layout(['A?', 'B?']) is puzzle_layout(('A?', 'B?'))
+    assert puzzle_layout(['A?', 'B?']) is not puzzle_layout(['A?', 'C?'])
@@ -0,0 +1,31 @@
+from keyword_buster import main
+from keyword_buster.cache import PatternCache
+from keyword_buster.dictionary import WordIndex
+from keyword_buster.signature import SignatureIndex
+
+WORDS = ['star', 'rats', 'arts', 'dog', 'god', 'cat']
+
+
+def test_signature_queries_share_one_index(monkeypatch):
+    built = []
+
+    class CountingSignatureIndex(SignatureIndex):
+        def __init__(self, word_index):
+            built.append(1)
+            super().__init__(word_index)
+
+    monkeypatch.setattr(main, 'SignatureIndex', CountingSignatureIndex)
+    word_list = WordIndex(WORDS)
+    patterns = ['anagram:tsar', 'anagram:odg', '?A?+CT', 'D?G']
+
+    results = main.find_all_matching_words(word_list, patterns, PatternCache(None))
+    assert sorted(results['anagram:tsar']) == ['arts', 'rats', 'star']
+    assert sorted(results['anagram:odg']) == ['dog', 'god']
+    assert results['?A?+CT'] == ['cat']
+    assert results['D?G'] == ['dog']
+    assert len(built) == 1
+
+    signatures = SignatureIndex(word_list)
+    results = main.find_all_matching_words(word_list, ['anagram:gdo'], None, signatures=signatures)
+    assert sorted(results['anagram:gdo']) == ['dog', 'god']
+    assert len(built) == 1
@@ -0,0 +1,36 @@
+import random
+
+from keyword_buster.dictionary import WordIndex
+from keyword_buster.matcher import match_patterns
+
+
+def random_patterns(words, count, seed):
+    rng = random.Random(seed)
+    patterns = []
+    for _ in range(count):
+        letters = list(rng.choice(words).upper())
+        for position in rng.sample(range(len(letters)), k=rng.randint(1, len(letters))):
+            letters[position] = '?'
+        patterns.append(''.join(letters))
+    return patterns
+
+
+def test_match_patterns_agrees_with_word_index_match():
+    rng = random.Random(1)
+    words = [''.join(rng.choice('aeirstln') for _ in range(rng.randint(1, 7))) for _ in range(5000)]
+    index = WordIndex(words)
+    patterns = random_patterns(words, 200, seed=2) + ['????', 'ZZZ', '?' * 20]
+    results = match_patterns(index, patterns)
+    assert results.keys() == set(patterns)
+    for pattern in patterns:
+        assert results[pattern] == index.match(pattern), pattern
+
+
+def test_match_patterns_folds_patterns_and_keeps_duplicates_apart():
+    index = WordIndex(['café', 'cafe', 'dog', 'log'])
+    assert match_patterns(index, ['caf?', 'CAF?', '?og']) == {
+        'caf?': ['café', 'cafe'],
+        'CAF?': ['café', 'cafe'],
+        '?og': ['dog', 'log'],
+    }
+    assert match_patterns(index, []) == {}
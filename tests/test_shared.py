@@ -0,0 +1,43 @@
+import random
+
+from keyword_buster.dictionary import FOLD_NONE, WordIndex
+from keyword_buster.matcher import match_patterns
+from keyword_buster.shared import SharedDictionary, SharedWordIndex, match_patterns_parallel
+
+WORDS = ['café', 'Cafe', 'straße', 'dog', 'log', 'hat', 'has', 'ham', 'miss', 'mist', 'Éclair']
+PATTERNS = ['caf?', '?OG', 'HA?', 'MI??', 'STRASS?', '?CLAIR', 'ZZZ', '???????????']
+
+
+def test_attached_index_matches_like_the_word_index():
+    for fold in ('accents', FOLD_NONE):
+        index = WordIndex(WORDS, fold)
+        with SharedDictionary(index) as shared:
+            attached = SharedWordIndex(shared.name)
+            try:
+                assert attached.fold == fold
+                assert attached.fingerprint == index.fingerprint
+                assert attached.match_patterns(PATTERNS) == match_patterns(index, PATTERNS)
+            finally:
+                attached.close()
+
+
+def test_parallel_matching_agrees_with_single_process():
+    rng = random.Random(5)
+    words = WORDS + [''.join(rng.choice('aeiouéstrln') for _ in range(rng.randint(1, 8))) for _ in range(3000)]
+    index = WordIndex(words)
+    patterns = PATTERNS + [''.join(rng.choice('AEST?') for _ in range(rng.randint(1, 8))) for _ in range(100)]
+    assert match_patterns_parallel(index, patterns, 3) == match_patterns(index, patterns)
+    assert match_patterns_parallel(index, [], 3) == {}
+
+
+def test_words_with_line_and_field_separators_survive_publishing():
+    word_index = WordIndex(['ab\x85c', 'ab c', 'ab\tc', 'ab\x0cc', 'abxc'], FOLD_NONE)
+    expected = match_patterns(word_index, ['AB?C'])
+    assert sorted(expected['AB?C']) == sorted(word_index.words)
+    with SharedDictionary(word_index) as shared:
+        attached = SharedWordIndex(shared.name)
+        try:
+            assert attached.match_patterns(['AB?C']) == expected
+        finally:
+            attached.close()
+    assert match_patterns_parallel(word_index, ['AB?C'], 2) == expected
@@ -0,0 +1,41 @@
+from keyword_buster.dictionary import WordIndex
+from keyword_buster.signature import SignatureIndex, letter_signature, parse_query
+
+WORDS = ['star', 'rats', 'arts', 'tsar', 'tars', 'stop', 'pots', 'post', 'tops', 'spot', 'opt', 'dog', 'god']
+
+
+def test_letter_signature_and_parse_query():
+    assert letter_signature('STAR') == 'ARST'
+    assert parse_query('anagram:star') == ('????', 'star')
+    assert parse_query('?A??+RST') == ('?A??', 'RST')
+    assert parse_query('?OG') is None
+
+
+def test_anagram_query_is_a_single_lookup():
+    signatures = SignatureIndex(WordIndex(WORDS))
+    assert sorted(signatures.query('anagram:RATS')) == ['arts', 'rats', 'star', 'tars', 'tsar']
+    assert signatures.anagrams('xyz') == []
+
+
+def test_pattern_plus_exact_and_spare_letters():
+    signatures = SignatureIndex(WordIndex(WORDS))
+    assert sorted(signatures.query('?A??+RST')) == ['rats', 'tars']
+    assert sorted(signatures.query('?O??+PSTXQ')) == ['post', 'pots', 'tops']
+    assert signatures.query('?O??+P') == []
+
+
+def test_spare_letter_query_matches_brute_force():
+    index = WordIndex(WORDS)
+    signatures = SignatureIndex(index)
+    letters = 'PSTAR'
+    expected = [word for word in index.match('????')
+                if all(word.upper().count(ch) <= ('O' + letters).count(ch) for ch in set(word.upper()))
+                and word.upper()[1] == 'O']
+    assert sorted(signatures.match('?O??', letters)) == sorted(expected)
+
+
+def test_arrangements_respect_every_column():
+    signatures = SignatureIndex(WordIndex(WORDS))
+    columns = [{'S', 'P'}, {'T', 'P'}, {'O'}, {'P', 'T'}]
+    assert sorted(signatures.arrangements('tops', columns)) == ['spot', 'stop']
+    assert signatures.arrangements('tops', [{'S', 'P'}, {'T', 'O'}]) == []
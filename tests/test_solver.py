@@ -0,0 +1,54 @@
+import random
+
+from keyword_buster.dictionary import WordIndex
+from keyword_buster.solver import KeywordSolver
+
+
+def brute_force_segmentations(words, letter_sets, max_segments, min_word_length):
+    """Every split of the letter sets into dictionary words, by trying every split point."""
+    folded = {word.upper() for word in words if len(word) >= min_word_length}
+    found = set()
+
+    def walk(start, phrase):
+        if start == len(letter_sets):
+            found.add(tuple(phrase))
+            return
+        if len(phrase) == max_segments:
+            return
+        for word in folded:
+            end = start + len(word)
+            if end <= len(letter_sets) and all(ch in letter_sets[start + k] for k, ch in enumerate(word)):
+                walk(end, phrase + [word])
+
+    walk(0, [])
+    return found
+
+
+def test_fewest_words_survive_the_result_cap():
+    solver = KeywordSolver(WordIndex(['ABCD', 'EF', 'GH', 'ABC', 'DEFGH']))
+    assert solver.segment('ABCDEFGH', 3, 1) == [('ABC', 'DEFGH')]
+    assert solver.segment('ABCDEFGH', 3, 10) == [('ABC', 'DEFGH'), ('ABCD', 'EF', 'GH')]
+    assert solver.segment('ABCDEFGH', 2, 10) == [('ABC', 'DEFGH')]
+
+
+def test_min_word_length_controls_single_letter_words():
+    solver = KeywordSolver(WordIndex(['A', 'I', 'AM', 'MAN', 'NAM']))
+    assert solver.segment(['A', 'M', 'A', 'N'], 3, 10) == []
+    assert solver.segment(['A', 'M', 'A', 'N'], 3, 10, min_word_length=1) == [('A', 'MAN')]
+
+
+def test_segment_matches_brute_force_on_letter_sets():
+    rng = random.Random(7)
+    words = list({''.join(rng.choice('ABCDE') for _ in range(rng.randint(1, 4))) for _ in range(150)})
+    solver = KeywordSolver(WordIndex(words))
+    for _ in range(30):
+        letter_sets = [set(rng.sample('ABCDE', rng.randint(1, 3))) for _ in range(rng.randint(1, 9))]
+        expected = brute_force_segmentations(words, letter_sets, 3, 2)
+        result = solver.segment(letter_sets, 3, 10 ** 6)
+        assert set(result) == expected
+        assert len(result) == len(expected)
+        assert [len(phrase) for phrase in result] == sorted(len(phrase) for phrase in result)
+
+
+def test_empty_sequence_has_no_segmentation():
+    assert KeywordSolver(WordIndex(['AB'])).segment([]) == []